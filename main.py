@@ -39,4 +39,15 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed (optional;
+    # uvloop.run needs uvloop >= 0.18)
+    try:
+        import uvloop
+        uvloop_run = uvloop.run
+    except (ImportError, AttributeError):
+        uvloop_run = None
+    
+    if uvloop_run:
+        uvloop_run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
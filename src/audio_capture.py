@@ -6,10 +6,35 @@ import numpy as np
 import threading
 import subprocess
 import time
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
 from .config import AudioConfig
 
 
+class PCMChunkPool:
+    """Fixed-size PCM chunk buffers carved out of one preallocated region."""
+    
+    def __init__(self, chunk_bytes: int, count: int):
+        """Preallocate count slots of chunk_bytes each."""
+        self.chunk_bytes = chunk_bytes
+        self.region = bytearray(chunk_bytes * count)
+        region_view = memoryview(self.region)
+        self.free: List[memoryview] = [
+            region_view[i * chunk_bytes:(i + 1) * chunk_bytes] for i in range(count)
+        ]
+    
+    def acquire(self) -> memoryview:
+        """Take a free slot, or a standalone buffer if the pool is exhausted."""
+        try:
+            return self.free.pop()
+        except IndexError:
+            return memoryview(bytearray(self.chunk_bytes))
+    
+    def release(self, chunk: memoryview):
+        """Return a slot to the pool; buffers not carved from the region are dropped."""
+        if chunk.obj is self.region and len(chunk) == self.chunk_bytes:
+            self.free.append(chunk)
+
+
 class AudioCapture:
     """Handles real-time audio capture from microphone."""
     
@@ -21,21 +46,34 @@ class AudioCapture:
         self.stream = None
         self.pyaudio = None
         
-        # Event handlers
-        self.on_audio_captured: Optional[Callable[[bytes], None]] = None
+        # Event handlers (captured chunks are pooled: only valid during the callback)
+        self.on_audio_captured: Optional[Callable[[memoryview], None]] = None
+        self.on_utterance_end: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[str, Exception], None]] = None
         
         # Audio processing
-        self.audio_buffer: List[bytes] = []
         self.silence_counter = 0
         self.recording = False
         self.min_recording_length = 0.5  # Minimum recording length in seconds
         self.max_recording_length = 10.0  # Maximum recording length in seconds
+        self._rec_chunks = 0
+        
+        # Chunks are streamed to the consumer as they are captured;
+        # None marks the end of an utterance
+        self._chunk_queue: Optional[asyncio.Queue] = None
+        self._delivery_task: Optional[asyncio.Task] = None
+        
+        # Pool of chunk buffers shared by the capture thread and the consumer
+        chunks_per_second = self.config.sample_rate / self.config.chunk_size
+        self._pool = PCMChunkPool(self.config.chunk_size * 2, int(2 * chunks_per_second) + 1)
+        
+        # Reusable float32 scratch for per-chunk RMS (avoids a copy per chunk)
+        self._rms_scratch = np.empty(self.config.chunk_size, dtype=np.float32)
+        self._compute_thresholds()
         
         # Threading
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.capture_thread = None
-        self.processing_thread = None
-        self.stop_event = threading.Event()
     
     async def start(self):
         """Start audio capture using PulseAudio."""
@@ -54,11 +92,15 @@ class AudioCapture:
             self.stream = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                bufsize=0  # raw pipe: read straight into our buffer
             )
             
+            self._compute_thresholds()
+            self._loop = asyncio.get_running_loop()
+            self._chunk_queue = asyncio.Queue()
+            self._delivery_task = asyncio.create_task(self._delivery_loop())
             self.is_running = True
-            self.stop_event.clear()
             
             # Start capture thread
             self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
@@ -77,16 +119,20 @@ class AudioCapture:
         try:
             self.logger.info("Stopping audio capture...")
             self.is_running = False
-            self.stop_event.set()
             
             # Stop PulseAudio process
             if self.stream:
                 self.stream.terminate()
                 self.stream = None
             
-            # Wait for processing thread to finish
-            if self.processing_thread and self.processing_thread.is_alive():
-                self.processing_thread.join(timeout=2.0)
+            # Stop delivering chunks to the consumer
+            if self._delivery_task:
+                self._delivery_task.cancel()
+                self._delivery_task = None
+            
+            # Wait for capture thread to finish
+            if self.capture_thread and self.capture_thread.is_alive():
+                self.capture_thread.join(timeout=2.0)
             
             self.logger.info("Audio capture stopped")
             
@@ -103,50 +149,49 @@ class AudioCapture:
         """Main capture loop for PulseAudio."""
         self.logger.debug("Audio capture loop started")
         
-        chunk_size = self.config.chunk_size * 2  # *2 for 16-bit samples
+        chunk = self._pool.acquire()
         
         while self.is_running and self.stream:
             try:
-                # Read audio from PulseAudio
-                raw_audio = self.stream.stdout.read(chunk_size)
+                # Read audio from PulseAudio straight into a pooled buffer
+                n = self._read_chunk(chunk)
+                raw_audio = chunk if n == len(chunk) else chunk[:n]
+                streamed = False
                 
-                if len(raw_audio) > 0:
-                    # Convert to numpy array
-                    audio_array = np.frombuffer(raw_audio, dtype=np.int16)
-                    
-                    # Calculate RMS for volume detection
-                    rms = np.sqrt(np.mean(audio_array.astype(np.float32)**2)) / 32768.0
-                    
-                    # Check if audio contains speech
-                    is_speech = rms > self.config.silence_threshold
+                if n > 0:
+                    # Check if audio contains speech (RMS above threshold)
+                    is_speech = self._is_speech_chunk(raw_audio)
                     
                     if is_speech:
                         if not self.recording:
                             self.logger.debug("Speech detected - starting recording")
                             self.recording = True
                             self.silence_counter = 0
-                            self.audio_buffer = []
+                            self._rec_chunks = 0
                         
-                        self.audio_buffer.append(raw_audio)
+                        self._stream_chunk(raw_audio)
+                        streamed = True
                         self.silence_counter = 0
                     else:
                         if self.recording:
                             self.silence_counter += 1
-                            self.audio_buffer.append(raw_audio)
+                            self._stream_chunk(raw_audio)
+                            streamed = True
                             
-                            # Check if we should stop recording
-                            silence_duration = self.silence_counter * self.config.chunk_size / self.config.sample_rate
-                            recording_duration = len(self.audio_buffer) * self.config.chunk_size / self.config.sample_rate
-                            
-                            if (silence_duration > self.config.silence_duration and 
-                                recording_duration > self.min_recording_length) or \
-                               recording_duration > self.max_recording_length:
+                            # Check if we should stop recording (limits are in chunks)
+                            if (self.silence_counter > self._silence_chunks_max and 
+                                self._rec_chunks > self._min_rec_chunks) or \
+                               self._rec_chunks > self._max_rec_chunks:
                                 
-                                self.logger.debug(f"Recording complete - duration: {recording_duration:.2f}s")
+                                self.logger.debug(f"Recording complete - {self._rec_chunks} chunks")
                                 self.recording = False
                                 
-                                # Trigger processing
-                                self._trigger_audio_processing()
+                                # Tell the consumer the utterance is complete
+                                self._end_utterance()
+                
+                # A streamed buffer now belongs to the consumer until released
+                if streamed:
+                    chunk = self._pool.acquire()
                 
             except Exception as e:
                 if self.is_running:
@@ -155,51 +200,79 @@ class AudioCapture:
         
         self.logger.debug("Audio capture loop stopped")
     
-    def _trigger_audio_processing(self):
-        """Trigger audio processing in async context."""
-        if self.audio_buffer and self.on_audio_captured:
-            audio_data = b''.join(self.audio_buffer)
-            self.audio_buffer = []
-            
-            # Create a new event loop for this thread if needed
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Schedule the async callback
-            if loop.is_running():
-                asyncio.create_task(self.on_audio_captured(audio_data))
-            else:
-                loop.run_until_complete(self.on_audio_captured(audio_data))
-    
-    def _processing_loop(self):
-        """Processing loop running in separate thread."""
-        self.logger.debug("Audio processing loop started")
-        
-        while not self.stop_event.wait(0.1):  # Check every 100ms
+    def _read_chunk(self, buffer: memoryview) -> int:
+        """Fill buffer from the raw parec pipe; returns bytes read (short only at EOF)."""
+        view = memoryview(buffer)
+        filled = 0
+        while filled < len(view):
+            n = self.stream.stdout.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        return filled
+    
+    def _stream_chunk(self, raw_audio: memoryview):
+        """Forward a captured chunk to the event loop as soon as it is read."""
+        self._rec_chunks += 1
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._chunk_queue.put_nowait, raw_audio)
+    
+    def _end_utterance(self):
+        """Queue the end-of-utterance marker behind the streamed chunks."""
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._chunk_queue.put_nowait, None)
+    
+    async def _delivery_loop(self):
+        """Deliver streamed chunks to the async handlers in capture order."""
+        while True:
+            chunk = await self._chunk_queue.get()
             try:
-                # Any additional processing can be done here
-                pass
+                if chunk is None:
+                    if self.on_utterance_end:
+                        await self.on_utterance_end()
+                elif self.on_audio_captured:
+                    await self.on_audio_captured(chunk)
             except Exception as e:
-                self.logger.error(f"Error in processing loop: {e}")
+                self.logger.error(f"Error delivering audio chunk: {e}")
+            finally:
+                if chunk is not None:
+                    self._pool.release(chunk)
+    
+    def _compute_thresholds(self):
+        """Precompute the capture loop's limits from the current configuration."""
+        # Per-sample squared int16 amplitude equivalent to silence_threshold
+        self._speech_energy_threshold = (self.config.silence_threshold * 32768.0) ** 2
         
-        self.logger.debug("Audio processing loop stopped")
+        # Durations expressed as whole chunks, so the loop compares integers
+        chunks_per_second = self.config.sample_rate / self.config.chunk_size
+        self._silence_chunks_max = int(self.config.silence_duration * chunks_per_second)
+        self._min_rec_chunks = int(self.min_recording_length * chunks_per_second)
+        self._max_rec_chunks = int(self.max_recording_length * chunks_per_second)
+    
+    def _chunk_energy(self, audio_chunk: bytes) -> Tuple[float, int]:
+        """Return the sum of squared int16 samples and the sample count."""
+        audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
+        n = audio_array.shape[0]
+        if n == 0:
+            return 0.0, 0
+        
+        if n > self._rms_scratch.shape[0]:
+            self._rms_scratch = np.empty(n, dtype=np.float32)
+        scratch = self._rms_scratch[:n]
+        
+        # Widen into the preallocated buffer, then square+sum via BLAS dot
+        np.copyto(scratch, audio_array)
+        return float(np.dot(scratch, scratch)), n
+    
+    def _is_speech_chunk(self, audio_chunk: bytes) -> bool:
+        """Compare chunk energy against the threshold without sqrt/division."""
+        sumsq, n = self._chunk_energy(audio_chunk)
+        return sumsq > self._speech_energy_threshold * n
     
     def _process_audio_chunk(self, audio_chunk: bytes) -> bool:
         """Process an audio chunk and detect speech/silence."""
         try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-            
-            # Calculate RMS for volume detection
-            rms = np.sqrt(np.mean(audio_array**2))
-            
-            # Normalize to 0-1 range
-            normalized_volume = rms / 32767.0
-            
-            return normalized_volume > self.config.silence_threshold
+            return self._is_speech_chunk(audio_chunk)
             
         except Exception as e:
             self.logger.error(f"Error processing audio chunk: {e}")
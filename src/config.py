@@ -7,6 +7,22 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 
 
+# Accepted values checked in Config._validate_config
+_VALID_MODELS = frozenset(("tiny", "base", "small", "medium", "large-v2", "large-v3"))
+_VALID_DEVICES = frozenset(("cpu", "cuda", "auto"))
+
+# Snapshot of os.environ taken on first use and shared by every Config
+_ENV_SNAPSHOT: Optional[Dict[str, str]] = None
+
+
+def _env() -> Dict[str, str]:
+    """Return the cached environment snapshot, taking it on first use."""
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        _ENV_SNAPSHOT = dict(os.environ)
+    return _ENV_SNAPSHOT
+
+
 @dataclass
 class AudioConfig:
     """Audio capture configuration."""
@@ -28,8 +44,9 @@ class WhisperConfig:
     beam_size: int = 1  # Fastest beam size
     temperature: float = 0.0
     vad_filter: bool = True  # Voice activity detection
-    chunk_length: int = 1  # shorter chunks for faster real-time response
-    overlap_length: float = 0.2  # shorter overlap for speed
+    partial_results: bool = False  # re-decode the utterance while speaking, for live display
+    chunk_length: int = 1  # seconds of new speech between partial-text re-decodes
+    overlap_length: float = 0.2  # unused: utterances are transcribed whole
 
 
 @dataclass
@@ -39,6 +56,7 @@ class ClaudeConfig:
     cli_path: Optional[str] = None
     timeout: int = 30
     max_retries: int = 3
+    focus_before_send: bool = True  # False: send input with --window, leaving focus alone
 
 
 @dataclass 
@@ -70,30 +88,45 @@ class Config:
         self._load_from_env()
         self._load_from_file()
         self._validate_config()
+        self._cached_dict: Optional[Dict[str, Any]] = None
     
     def _load_from_env(self):
         """Load configuration from environment variables."""
+        env = _env()
+        
         # Whisper configuration
-        if model_size := os.getenv("WHISPER_MODEL_SIZE"):
+        if model_size := env.get("WHISPER_MODEL_SIZE"):
             self.whisper.model_size = model_size
             
-        if device := os.getenv("WHISPER_DEVICE"):
+        if device := env.get("WHISPER_DEVICE"):
             self.whisper.device = device
             
-        if compute_type := os.getenv("WHISPER_COMPUTE_TYPE"):
+        if compute_type := env.get("WHISPER_COMPUTE_TYPE"):
             self.whisper.compute_type = compute_type
             
+        if env.get("WHISPER_PARTIAL_RESULTS", "").lower() == "true":
+            self.whisper.partial_results = True
+            
         # Claude configuration
-        if claude_path := os.getenv("CLAUDE_CLI_PATH"):
+        if claude_path := env.get("CLAUDE_CLI_PATH"):
             self.claude.cli_path = claude_path
             
+        if env.get("CLAUDE_FOCUS_BEFORE_SEND", "").lower() == "false":
+            self.claude.focus_before_send = False
+            
         # General settings
-        if log_level := os.getenv("LOG_LEVEL"):
+        if log_level := env.get("LOG_LEVEL"):
             self.log_level = log_level.upper()
             
-        if os.getenv("DEBUG_MODE", "").lower() == "true":
+        if env.get("DEBUG_MODE", "").lower() == "true":
             self.debug_mode = True
     
+    @staticmethod
+    def invalidate_env_cache():
+        """Drop the environment snapshot so the next Config re-reads os.environ."""
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = None
+    
     def _load_from_file(self):
         """Load configuration from config file if it exists."""
         config_path = Path(self.config_file)
@@ -104,25 +137,31 @@ class Config:
     def _validate_config(self):
         """Validate configuration settings."""
         # Validate Whisper model size
-        valid_models = ["tiny", "base", "small", "medium", "large-v2", "large-v3"]
-        if self.whisper.model_size not in valid_models:
-            raise ValueError(f"Invalid Whisper model size: {self.whisper.model_size}. Valid options: {valid_models}")
+        if self.whisper.model_size not in _VALID_MODELS:
+            raise ValueError(f"Invalid Whisper model size: {self.whisper.model_size}. Valid options: {sorted(_VALID_MODELS)}")
             
         # Validate device
-        valid_devices = ["cpu", "cuda", "auto"]
-        if self.whisper.device not in valid_devices:
-            raise ValueError(f"Invalid device: {self.whisper.device}. Valid options: {valid_devices}")
+        if self.whisper.device not in _VALID_DEVICES:
+            raise ValueError(f"Invalid device: {self.whisper.device}. Valid options: {sorted(_VALID_DEVICES)}")
             
         if self.debug_mode:
             self.log_level = "DEBUG"
     
+    def invalidate_cache(self):
+        """Forget the cached get_dict() snapshot after mutating settings."""
+        self._cached_dict = None
+    
     def get_dict(self) -> Dict[str, Any]:
-        """Get configuration as dictionary for debugging."""
-        return {
+        """Get configuration as dictionary for debugging (cached)."""
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
+        self._cached_dict = {
             "audio": self.audio.__dict__,
             "whisper": self.whisper.__dict__,
             "claude": self.claude.__dict__,
             "feedback": self.feedback.__dict__,
             "log_level": self.log_level,
             "debug_mode": self.debug_mode,
-        }
\ No newline at end of file
+        }
+        return self._cached_dict
@@ -4,18 +4,23 @@ import asyncio
 import logging
 import sys
 import re
-from typing import Optional
+from typing import Optional, Callable, Awaitable, Iterable
 from .config import FeedbackConfig
 
 
 class FeedbackSystem:
     """Provides audio and visual feedback to users with real-time text display."""
     
+    # Pre-encoded ANSI escape sequences
+    _CLEAR_SCREEN = b"\033[2J\033[H"
+    _CLEAR_LINE = b"\r\033[K"
+    _CURSOR_UP = {n: f"\033[{n}A".encode() for n in range(1, 17)}
+    
     def __init__(self, config: FeedbackConfig, terminal_controller=None):
         """Initialize feedback system."""
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.terminal_controller = terminal_controller
+        self.terminal_controller = terminal_controller  # binds _send_feedback
         
         # State
         self.tts_engine = None
@@ -26,18 +31,31 @@ class FeedbackSystem:
         # Text concatenation state
         self.accumulated_text = ""
         self.is_accumulating = False
-        self.finalization_keywords = ["send this prompt", "send prompt"]
+        self.finalization_keywords = ("send this prompt", "send prompt")
+    
+    @property
+    def terminal_controller(self):
+        """Terminal controller that receives feedback messages."""
+        return self._terminal_controller
+    
+    @terminal_controller.setter
+    def terminal_controller(self, controller):
+        # Resolve the send method once instead of on every message
+        self._terminal_controller = controller
+        self._send_feedback: Optional[Callable[[str], Awaitable[None]]] = (
+            getattr(controller, 'send_feedback_message', None) if controller else None
+        )
     
     async def _output_feedback(self, message: str, local_only: bool = False):
         """Output feedback to appropriate destination."""
         # Don't output to local console anymore - remove visual clutter
         # Only log for debugging purposes
-        self.logger.debug(f"Feedback: {message}")
+        self.logger.debug("Feedback: %s", message)
         
         # Also send to target terminal if available and not local_only
-        if not local_only and self.terminal_controller and hasattr(self.terminal_controller, 'send_feedback_message'):
+        if not local_only and self._send_feedback:
             try:
-                await self.terminal_controller.send_feedback_message(message)
+                await self._send_feedback(message)
             except Exception as e:
                 self.logger.debug(f"Could not send to terminal: {e}")
     
@@ -58,9 +76,22 @@ class FeedbackSystem:
             self.logger.error(f"Failed to initialize feedback system: {e}")
             raise
     
+    def _write_ansi(self, sequence: bytes):
+        """Write a raw escape sequence to the terminal."""
+        out = sys.stdout
+        buffer = getattr(out, 'buffer', None)
+        if buffer is None:
+            # Text-only stream (StringIO, captured output): write decoded text
+            out.write(sequence.decode())
+            out.flush()
+            return
+        out.flush()  # keep ordering with anything printed before
+        buffer.write(sequence)
+        buffer.flush()
+    
     def _clear_screen(self):
         """Clear terminal screen."""
-        print("\033[2J\033[H", end="")
+        self._write_ansi(self._CLEAR_SCREEN)
     
     def _show_header(self):
         """Show application header."""
@@ -96,14 +127,14 @@ class FeedbackSystem:
             return
             
         # Only log partial text, don't send to Claude terminal
-        self.logger.debug(f"Partial text: {clean_text}")
+        self.logger.debug("Partial text: %s", clean_text)
         
         # Don't send partial text to Claude - wait for accumulation/finalization
     
     async def show_recognized_text(self, text: str):
         """Show final recognized speech text."""
         # Only log recognized text, don't send to Claude terminal
-        self.logger.debug(f"Recognized: '{text}'")
+        self.logger.debug("Recognized: '%s'", text)
         
         # Don't send recognized text to Claude - wait for accumulation/finalization
         
@@ -112,20 +143,22 @@ class FeedbackSystem:
     
     async def show_text_accumulation_started(self, text: str):
         """Show that text accumulation has started."""
-        self.logger.info(f"Started accumulating: {text}")
+        self.logger.info("Started accumulating: %s", text)
         
         # Removed sending tags to Claude terminal - keep only in logs
     
-    async def show_text_accumulated(self, new_text: str, full_text: str):
-        """Show that additional text has been accumulated."""
-        self.logger.info(f"Added: {new_text} | Full: {full_text}")
+    async def show_text_accumulated(self, new_text: str, words: Iterable[str]):
+        """Show that additional text has been accumulated (words typed so far)."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Added: %s | Full: %s", new_text, " ".join(words))
         
         # Removed sending tags to Claude terminal - keep only in logs
     
     async def show_finalization_ready(self, keywords: list):
         """Show available finalization keywords."""
-        keywords_str = " / ".join([f'"{k}"' for k in keywords])
-        self.logger.info(f"Ready to finalize. Say: {keywords_str}")
+        if self.logger.isEnabledFor(logging.INFO):
+            keywords_str = " / ".join([f'"{k}"' for k in keywords])
+            self.logger.info("Ready to finalize. Say: %s", keywords_str)
         
         # Removed sending ready prompt to Claude terminal - keep only in logs
     
@@ -140,7 +173,7 @@ class FeedbackSystem:
     async def show_success(self, message: str = "Command completed successfully"):
         """Show successful command execution."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Success: {message}")
+        self.logger.info("Success: %s", message)
         
         if self.config.voice_feedback:
             await self._speak("Command completed successfully")
@@ -152,7 +185,7 @@ class FeedbackSystem:
     async def show_error(self, error_message: str):
         """Show error message."""
         # Don't show local visual feedback anymore
-        self.logger.error(f"Error: {error_message}")
+        self.logger.error("Error: %s", error_message)
         
         if self.config.voice_feedback:
             await self._speak(f"Error: {error_message}")
@@ -164,7 +197,7 @@ class FeedbackSystem:
     async def show_info(self, message: str):
         """Show informational message."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Info: {message}")
+        self.logger.info("Info: %s", message)
         
         if self.config.voice_feedback:
             await self._speak(message)
@@ -172,22 +205,22 @@ class FeedbackSystem:
     async def show_mode_switch(self, mode: str):
         """Show Claude mode switch."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Switched to {mode.upper()} mode")
+        self.logger.info("Switched to %s mode", mode.upper())
     
     async def show_selection(self, selection: str):
         """Show option selection."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Selected: {selection}")
+        self.logger.info("Selected: %s", selection)
     
     async def show_confirmation(self, response: str):
         """Show confirmation response."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Confirmation: {response.title()}")
+        self.logger.info("Confirmation: %s", response.title())
     
     async def request_confirmation(self, command: str) -> bool:
         """Request user confirmation for command."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Requesting confirmation for: {command}")
+        self.logger.info("Requesting confirmation for: %s", command)
         
         if self.config.voice_feedback:
             await self._speak(f"Confirm command: {command}")
@@ -199,7 +232,7 @@ class FeedbackSystem:
     async def show_command_options(self, commands: list):
         """Show available command options."""
         # Don't show local visual feedback anymore
-        self.logger.info(f"Available commands: {commands}")
+        self.logger.info("Available commands: %s", commands)
     
     async def show_status(self, status: str, details: str = ""):
         """Show system status."""
@@ -213,11 +246,11 @@ class FeedbackSystem:
         if self.config.voice_feedback:
             await self._speak(status)
     
-    async def show_volume_level(self, level: float):
-        """Show current microphone volume level."""
+    def show_volume_level(self, level: float) -> None:
+        """Show current microphone volume level (sync: cheap to call per chunk)."""
         # Don't show local visual feedback anymore
         if level > 0.1:
-            self.logger.debug(f"Volume level: {level:.1%}")
+            self.logger.debug("Volume level: %.1f%%", level * 100)
     
     async def _speak(self, text: str):
         """Convert text to speech."""
@@ -225,11 +258,12 @@ class FeedbackSystem:
             if not self.config.voice_feedback:
                 return
             
-            self.logger.debug(f"Speaking: '{text}'")
+            self.logger.debug("Speaking: '%s'", text)
             
-            # TODO: Implement actual text-to-speech
-            # Placeholder: just log the speech
-            await asyncio.sleep(0.1)  # Simulate speech time
+            # TODO: Implement actual text-to-speech, off the event loop
+            # (run_in_executor) so it does not stall the pipeline
+            # Placeholder: just log the speech and yield once
+            await asyncio.sleep(0)
             
         except Exception as e:
             self.logger.error(f"Error in text-to-speech: {e}")
@@ -241,7 +275,7 @@ class FeedbackSystem:
                 return
             
             # TODO: Implement actual sound playback
-            self.logger.debug(f"Playing sound: {sound_type}")
+            self.logger.debug("Playing sound: %s", sound_type)
             
         except Exception as e:
             self.logger.error(f"Error playing sound: {e}")
@@ -249,12 +283,13 @@ class FeedbackSystem:
     def _move_cursor_up(self, lines: int = 1):
         """Move cursor up N lines."""
         if self.visual_enabled:
-            print(f"\033[{lines}A", end="")
+            sequence = self._CURSOR_UP.get(lines) or f"\033[{lines}A".encode()
+            self._write_ansi(sequence)
     
     def _clear_current_line(self):
         """Clear current terminal line."""
         if self.visual_enabled:
-            print("\r\033[K", end="", flush=True)
+            self._write_ansi(self._CLEAR_LINE)
     
     async def cleanup(self):
         """Cleanup feedback system resources."""
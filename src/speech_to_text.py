@@ -1,16 +1,44 @@
 """Real-time speech-to-text service using local Whisper."""
 
 import asyncio
+import collections
+import functools
 import logging
 import numpy as np
 import threading
-import queue
 import time
 import io
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Dict, Tuple, Any
 from .config import WhisperConfig
 
 
+# Loaded Whisper models shared across service instances,
+# keyed by (model_size, device, compute_type)
+_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+
+# Optional heavy dependencies, imported once on first use
+_whisper_mod = None
+_webrtcvad_mod = None
+
+
+def _get_whisper():
+    """Import faster_whisper once and return the module."""
+    global _whisper_mod
+    if _whisper_mod is None:
+        import faster_whisper
+        _whisper_mod = faster_whisper
+    return _whisper_mod
+
+
+def _get_webrtcvad():
+    """Import webrtcvad once and return the module."""
+    global _webrtcvad_mod
+    if _webrtcvad_mod is None:
+        import webrtcvad
+        _webrtcvad_mod = webrtcvad
+    return _webrtcvad_mod
+
+
 class SpeechToTextService:
     """Handles real-time speech-to-text conversion using local Whisper."""
     
@@ -29,15 +57,32 @@ class SpeechToTextService:
         self.vad = None  # Voice Activity Detection
         
         # Real-time processing
-        self.audio_queue = queue.Queue()
+        self._main_loop: Optional[asyncio.AbstractEventLoop] = None
         self.processing_thread = None
         self.stop_event = threading.Event()
         self.is_running = False
         
-        # Audio buffering for streaming
-        self.audio_buffer = []
-        self.buffer_duration = 0.0
+        # Audio buffering for streaming: preallocated float32 slab for
+        # Whisper plus an int16 mirror of the same samples for VAD
         self.sample_rate = 16000  # Whisper expects 16kHz
+        self._buf = np.empty(self.sample_rate * 30, dtype=np.float32)
+        self._pcm = np.empty(self.sample_rate * 30, dtype=np.int16)
+        self._buf_len = 0
+        
+        # Rolling partials (opt-in): the utterance so far is re-decoded each
+        # time it grows by chunk_length; the final text is decoded once at its end
+        self._partial_step = int(self.config.chunk_length * self.sample_rate)
+        self._next_partial = self._partial_step
+        self.partials_paused = False  # set by the owner while partials would be ignored
+        
+        # Single-producer/single-consumer int16 ring (~5s) between
+        # process_audio and the processing thread. Positions only grow;
+        # the producer owns the tail, the processing thread owns the head.
+        self._ring = np.empty(self.sample_rate * 5, dtype=np.int16)
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._utterance_ends = collections.deque()  # ring positions where utterances end
+        self._data_ready = threading.Event()
     
     async def initialize(self):
         """Initialize the speech-to-text service."""
@@ -46,15 +91,26 @@ class SpeechToTextService:
             
             # Load faster-whisper model
             try:
-                from faster_whisper import WhisperModel
+                WhisperModel = _get_whisper().WhisperModel
                 
-                self.logger.info(f"Loading Whisper model: {self.config.model_size}")
-                self.model = WhisperModel(
-                    self.config.model_size,
-                    device=self.config.device,
-                    compute_type=self.config.compute_type
-                )
-                self.logger.info("Whisper model loaded successfully")
+                key = (self.config.model_size, self.config.device, self.config.compute_type)
+                self.model = _MODEL_CACHE.get(key)
+                if self.model is None:
+                    self.logger.info("Loading Whisper model: %s", self.config.model_size)
+                    # Load in a worker thread so other components can start meanwhile
+                    self.model = await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        functools.partial(
+                            WhisperModel,
+                            self.config.model_size,
+                            device=self.config.device,
+                            compute_type=self.config.compute_type
+                        )
+                    )
+                    _MODEL_CACHE[key] = self.model
+                    self.logger.info("Whisper model loaded successfully")
+                else:
+                    self.logger.info("Reusing loaded Whisper model: %s", self.config.model_size)
                 
             except ImportError:
                 self.logger.error("faster-whisper not installed. Please install: pip install faster-whisper")
@@ -66,14 +122,14 @@ class SpeechToTextService:
             # Initialize Voice Activity Detection (optional)
             if self.config.vad_filter:
                 try:
-                    import webrtcvad
-                    self.vad = webrtcvad.Vad(3)  # Aggressiveness level 0-3
+                    self.vad = _get_webrtcvad().Vad(3)  # Aggressiveness level 0-3
                     self.logger.info("Voice Activity Detection enabled")
                 except ImportError:
                     self.logger.warning("webrtcvad not available, VAD disabled")
                     self.config.vad_filter = False
             
-            # Start processing thread
+            # Start processing thread; callbacks are handed back to this loop
+            self._main_loop = asyncio.get_running_loop()
             self.stop_event.clear()
             self.processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
             self.processing_thread.start()
@@ -85,93 +141,151 @@ class SpeechToTextService:
             self.logger.error(f"Failed to initialize speech service: {e}")
             raise
     
-    async def process_audio(self, audio_data: bytes):
-        """Process audio data and add to processing queue."""
+    async def process_audio(self, audio_data: memoryview):
+        """Process audio data and add to processing queue (copies; caller may reuse the buffer)."""
         try:
             if not self.is_running:
                 return
             
-            # Convert audio data to numpy array and resample if needed
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            
-            # Put audio in processing queue for real-time processing
-            try:
-                self.audio_queue.put_nowait(audio_array)
-            except queue.Full:
-                self.logger.warning("Audio queue full, dropping audio chunk")
+            # Copy raw int16 samples into the ring; the float conversion
+            # happens in the processing loop
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            self._ring_write(samples)
                 
         except Exception as e:
             self.logger.error(f"Error queuing audio: {e}")
             if self.on_error:
                 await self.on_error("SpeechToText", e)
     
+    async def end_utterance(self):
+        """Mark the end of an utterance so it is transcribed as a whole."""
+        if self.is_running:
+            self._utterance_ends.append(self._ring_tail)
+            self._data_ready.set()
+    
+    def _ring_write(self, samples: np.ndarray):
+        """Producer side: append samples to the ring, or drop them if it is full."""
+        size = self._ring.shape[0]
+        n = samples.shape[0]
+        tail = self._ring_tail
+        if tail - self._ring_head + n > size:
+            self.logger.warning("Audio ring buffer full, dropping audio chunk")
+            return
+        
+        start = tail % size
+        first = min(n, size - start)
+        self._ring[start:start + first] = samples[:first]
+        self._ring[:n - first] = samples[first:]
+        
+        # Publish only after the samples are in place
+        self._ring_tail = tail + n
+        self._data_ready.set()
+    
     def _processing_loop(self):
         """Main processing loop for real-time speech recognition."""
         self.logger.debug("Speech processing loop started")
         
+        size = self._ring.shape[0]
+        ends = self._utterance_ends
+        
         while not self.stop_event.is_set():
             try:
-                # Get audio from queue with timeout
-                try:
-                    audio_chunk = self.audio_queue.get(timeout=0.1)
-                except queue.Empty:
+                # Wait for the producer with timeout
+                if not self._data_ready.wait(timeout=0.1):
                     continue
+                self._data_ready.clear()
                 
-                # Add to buffer
-                self.audio_buffer.extend(audio_chunk)
-                chunk_duration = len(audio_chunk) / self.sample_rate
-                self.buffer_duration += chunk_duration
+                # Drain the ring up to each pending utterance end, transcribing
+                # every utterance whole and once, then the rest of the audio
+                while True:
+                    end = ends[0] if ends else self._ring_tail
+                    head = self._ring_head
+                    while head < end:
+                        start = head % size
+                        n = min(end - head, size - start)
+                        self._append_to_buffer(self._ring[start:start + n])
+                        head += n
+                        self._ring_head = head
+                    
+                    if not ends:
+                        break
+                    ends.popleft()
+                    self._process_utterance()
                 
-                # Process when we have enough audio
-                if self.buffer_duration >= self.config.chunk_length:
-                    self._process_buffer()
+                # Still speaking: refresh the partial text for display, unless
+                # an utterance end is already waiting for the final decode
+                if (self.config.partial_results and not self.partials_paused
+                        and not ends and self._buf_len >= self._next_partial):
+                    self._process_partial()
+                    self._next_partial = self._buf_len + self._partial_step
                 
             except Exception as e:
                 self.logger.error(f"Error in processing loop: {e}")
         
         self.logger.debug("Speech processing loop stopped")
     
-    def _process_buffer(self):
-        """Process accumulated audio buffer."""
+    def _append_to_buffer(self, audio_chunk: np.ndarray):
+        """Convert int16 samples to float32 directly into the buffer slab."""
+        capacity = self._buf.shape[0]
+        if audio_chunk.shape[0] > capacity:
+            audio_chunk = audio_chunk[-capacity:]
+        n = audio_chunk.shape[0]
+        
+        if self._buf_len + n > capacity:
+            # Utterance longer than the slab: report what we have so far
+            self.logger.warning("Audio buffer full, transcribing utterance so far")
+            self._process_utterance()
+        
+        self._pcm[self._buf_len:self._buf_len + n] = audio_chunk
+        np.multiply(audio_chunk, 1.0 / 32768.0, out=self._buf[self._buf_len:self._buf_len + n])
+        self._buf_len += n
+    
+    def _process_partial(self):
+        """Re-decode the utterance so far, for real-time display only."""
         try:
-            if not self.audio_buffer:
+            if not self.on_partial_text or not self._buf_len:
                 return
             
-            # Convert to numpy array
-            audio_array = np.array(self.audio_buffer, dtype=np.float32)
+            audio_16k = self._resample_audio(self._buf[:self._buf_len])
+            text, _ = self._transcribe_audio(audio_16k)
+            if text.strip():
+                self._trigger_callback(self.on_partial_text, text)
+                
+        except Exception as e:
+            self.logger.error(f"Error processing partial audio: {e}")
+    
+    def _process_utterance(self):
+        """Transcribe the complete utterance once and report it, then reset."""
+        try:
+            if not self._buf_len:
+                return
+            
+            # View of the buffered audio (no copy)
+            audio_array = self._buf[:self._buf_len]
             
             # Voice Activity Detection
             if self.config.vad_filter and self.vad:
-                if not self._has_speech(audio_array):
-                    self._reset_buffer()
+                if not self._has_speech(self._pcm[:self._buf_len]):
                     return
             
             # Resample to 16kHz if needed
-            if len(audio_array) > 0:
-                audio_16k = self._resample_audio(audio_array)
-                
-                # Transcribe with Whisper
-                text, confidence = self._transcribe_audio(audio_16k)
-                
-                if text.strip():
-                    # Send partial text for real-time display
-                    if self.on_partial_text:
-                        self._trigger_callback(self.on_partial_text, text)
-                    
-                    # Send final recognition
-                    if confidence > 0.3:  # Confidence threshold
-                        self._trigger_callback(self.on_text_recognized, text, confidence)
+            audio_16k = self._resample_audio(audio_array)
             
-            # Reset buffer with overlap
-            overlap_samples = int(self.config.overlap_length * self.sample_rate)
-            if len(self.audio_buffer) > overlap_samples:
-                self.audio_buffer = self.audio_buffer[-overlap_samples:]
-                self.buffer_duration = self.config.overlap_length
-            else:
-                self._reset_buffer()
+            # Transcribe with Whisper
+            text, confidence = self._transcribe_audio(audio_16k)
+            
+            if text.strip():
+                # Show the final text in place of the partials
+                if self.on_partial_text:
+                    self._trigger_callback(self.on_partial_text, text)
+                
+                # Send final recognition
+                if confidence > 0.3:  # Confidence threshold
+                    self._trigger_callback(self.on_text_recognized, text, confidence)
                 
         except Exception as e:
             self.logger.error(f"Error processing audio buffer: {e}")
+        finally:
             self._reset_buffer()
     
     def _transcribe_audio(self, audio: np.ndarray) -> tuple[str, float]:
@@ -185,60 +299,59 @@ class SpeechToTextService:
                 audio,
                 language=self.config.language,
                 beam_size=self.config.beam_size,
+                best_of=1,
                 temperature=self.config.temperature,
                 vad_filter=False,  # We handle VAD ourselves
-                word_timestamps=True
+                without_timestamps=True,  # only text and avg_logprob are used
+                condition_on_previous_text=False,  # utterances are decoded independently
+                initial_prompt=None
             )
             
-            # Combine segments
-            text_parts = []
-            total_confidence = 0.0
-            segment_count = 0
-            
-            for segment in segments:
-                text_parts.append(segment.text.strip())
-                total_confidence += getattr(segment, 'avg_logprob', -1.0)
-                segment_count += 1
+            # Combine segments in one pass over the generator
+            parts = [(segment.text.strip(), getattr(segment, 'avg_logprob', -1.0)) for segment in segments]
+            if not parts:
+                return "", 0.0
             
-            text = " ".join(text_parts).strip()
-            confidence = max(0.0, (total_confidence / segment_count + 1.0)) if segment_count > 0 else 0.0
+            texts, logprobs = zip(*parts)
+            text = " ".join(texts).strip()
+            confidence = max(0.0, sum(logprobs) / len(logprobs) + 1.0)
             
-            self.logger.debug(f"Transcribed: '{text}' (confidence: {confidence:.3f})")
+            self.logger.debug("Transcribed: '%s' (confidence: %.3f)", text, confidence)
             return text, confidence
             
         except Exception as e:
             self.logger.error(f"Error transcribing audio: {e}")
             return "", 0.0
     
-    def _has_speech(self, audio: np.ndarray) -> bool:
-        """Check if audio contains speech using VAD."""
+    def _has_speech(self, audio_16bit: np.ndarray) -> bool:
+        """Check if int16 PCM audio contains speech using VAD."""
         if not self.vad:
             return True
         
         try:
-            # Convert to 16-bit PCM
-            audio_16bit = (audio * 32767).astype(np.int16).tobytes()
-            
             # VAD requires specific frame sizes (10, 20, or 30ms)
             frame_duration = 30  # ms
             frame_size = int(self.sample_rate * frame_duration / 1000)
             
-            # Check frames for speech
-            speech_frames = 0
-            total_frames = 0
-            
-            for i in range(0, len(audio_16bit) - frame_size * 2, frame_size * 2):
-                frame = audio_16bit[i:i + frame_size * 2]
-                if len(frame) == frame_size * 2:  # Ensure full frame
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        speech_frames += 1
-                    total_frames += 1
-            
+            # Reshape into whole frames (a view, no copy)
+            total_frames = audio_16bit.shape[0] // frame_size
             if total_frames == 0:
                 return False
+            frames = audio_16bit[:total_frames * frame_size].reshape(total_frames, frame_size)
+            
+            # Speech if more than 30% of frames contain speech; stop as soon
+            # as the outcome is decided either way
+            needed = total_frames * 0.3
+            speech_frames = 0
+            for i, frame in enumerate(frames):
+                if self.vad.is_speech(frame.tobytes(), self.sample_rate):
+                    speech_frames += 1
+                    if speech_frames > needed:
+                        return True
+                elif speech_frames + (total_frames - i - 1) <= needed:
+                    return False
             
-            speech_ratio = speech_frames / total_frames
-            return speech_ratio > 0.3  # 30% of frames contain speech
+            return False
             
         except Exception as e:
             self.logger.debug(f"VAD error: {e}")
@@ -251,18 +364,14 @@ class SpeechToTextService:
     
     def _reset_buffer(self):
         """Reset audio buffer."""
-        self.audio_buffer = []
-        self.buffer_duration = 0.0
+        self._buf_len = 0
+        self._next_partial = self._partial_step
     
     def _trigger_callback(self, callback, *args):
-        """Trigger async callback from sync context."""
-        if callback:
+        """Hand an async callback from the processing thread to the main loop."""
+        if callback and self._main_loop:
             try:
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(callback(*args))
-                loop.close()
+                asyncio.run_coroutine_threadsafe(callback(*args), self._main_loop)
             except Exception as e:
                 self.logger.error(f"Error triggering callback: {e}")
     
@@ -277,14 +386,11 @@ class SpeechToTextService:
         if self.processing_thread and self.processing_thread.is_alive():
             self.processing_thread.join(timeout=2.0)
         
-        # Clear queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Drop any unprocessed audio
+        self._ring_head = self._ring_tail
+        self._utterance_ends.clear()
         
-        self.model = None
+        self.model = None  # the model itself stays in _MODEL_CACHE for reuse
         self.vad = None
         
         self.logger.info("Speech-to-text service cleanup complete")
\ No newline at end of file
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+import shutil
 import subprocess
+import sys
 import time
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Sequence, Tuple
 
 from .config import ClaudeConfig
 
@@ -30,6 +32,17 @@ class UniversalTerminalController:
         self.is_target_set = False
         self.focus_countdown = 5  # seconds to focus on target window
         
+        # Window name/class per window id (cleared on recapture)
+        self._name_cache: Dict[str, str] = {}
+        self._class_cache: Dict[str, str] = {}
+        
+        # Ready-built xdotool argv per (command, args) for the current target
+        self._argv_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        
+        # Keys waiting to be sent, batched into one xdotool call
+        self._pending_keys: List[Tuple[str, asyncio.Future]] = []
+        self._key_flusher: Optional[asyncio.Task] = None
+        
         # Removed command mappings - focusing on natural language only
     
     async def initialize(self):
@@ -52,6 +65,11 @@ class UniversalTerminalController:
     
     async def _check_xdotool_available(self) -> bool:
         """Check if xdotool is available and working."""
+        # PATH lookup first: no point forking if the binary is missing
+        if shutil.which('xdotool') is None:
+            self.logger.error("xdotool not found in PATH")
+            return False
+        
         try:
             process = await asyncio.create_subprocess_exec(
                 'xdotool', 'getwindowfocus',
@@ -88,10 +106,12 @@ class UniversalTerminalController:
             print("3. Wait for the countdown to finish")
             print("")
             
-            # Countdown
-            for i in range(self.focus_countdown, 0, -1):
-                print(f"⏰ Focus on your target terminal now... {i} seconds remaining", end='\r')
-                await asyncio.sleep(1)
+            # Countdown: park on a single sleep while a background task prints
+            printer = asyncio.create_task(self._print_countdown())
+            try:
+                await asyncio.sleep(self.focus_countdown)
+            finally:
+                printer.cancel()
             
             print("\n🎯 Capturing focused window...                              ")
             
@@ -107,9 +127,11 @@ class UniversalTerminalController:
             if process.returncode == 0:
                 self.target_window_id = stdout.decode('utf-8').strip()
                 
-                # Get window details
-                window_name = await self._get_window_name(self.target_window_id)
-                window_class = await self._get_window_class(self.target_window_id)
+                # Get window details (independent lookups, run concurrently)
+                window_name, window_class = await asyncio.gather(
+                    self._get_window_name(self.target_window_id),
+                    self._get_window_class(self.target_window_id)
+                )
                 
                 print(f"✅ Target window captured!")
                 print(f"   Window ID: {self.target_window_id}")
@@ -140,8 +162,20 @@ class UniversalTerminalController:
             self.logger.error(f"Error capturing target window: {e}")
             raise
     
+    async def _print_countdown(self):
+        """Print the focus countdown once per second until cancelled."""
+        write, flush = sys.stdout.write, sys.stdout.flush
+        for i in range(self.focus_countdown, 0, -1):
+            # One write and one flush per tick, overwriting the line in place
+            write(f"\r⏰ Focus on your target terminal now... {i} seconds remaining")
+            flush()
+            await asyncio.sleep(1)
+    
     async def _get_window_name(self, window_id: str) -> str:
         """Get window name safely."""
+        if window_id in self._name_cache:
+            return self._name_cache[window_id]
+        
         try:
             process = await asyncio.create_subprocess_exec(
                 'xdotool', 'getwindowname', window_id,
@@ -152,7 +186,9 @@ class UniversalTerminalController:
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=1)
             
             if process.returncode == 0:
-                return stdout.decode('utf-8').strip()
+                window_name = stdout.decode('utf-8').strip()
+                self._name_cache[window_id] = window_name
+                return window_name
             return "Unknown"
             
         except Exception:
@@ -160,6 +196,9 @@ class UniversalTerminalController:
     
     async def _get_window_class(self, window_id: str) -> str:
         """Get window class safely."""
+        if window_id in self._class_cache:
+            return self._class_cache[window_id]
+        
         try:
             process = await asyncio.create_subprocess_exec(
                 'xdotool', 'getwindowclassname', window_id,
@@ -170,7 +209,9 @@ class UniversalTerminalController:
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=1)
             
             if process.returncode == 0:
-                return stdout.decode('utf-8').strip()
+                window_class = stdout.decode('utf-8').strip()
+                self._class_cache[window_id] = window_class
+                return window_class
             return "Unknown"
             
         except Exception:
@@ -210,12 +251,12 @@ class UniversalTerminalController:
             raise RuntimeError("No target window set")
         
         try:
-            # Activate the window first
-            await self._run_xdotool(['windowactivate', self.target_window_id])
-            await asyncio.sleep(0.1)
-            
-            # Send the text
-            await self._run_xdotool(['type', '--delay', '50', text])
+            # The text is streamed on stdin rather than argv, so it needs
+            # no escaping or length limit
+            await self._run_xdotool(
+                self._targeted('type', '--file', '-'), input=text.encode('utf-8'),
+                capture_stdout=False
+            )
             
             self.logger.debug(f"Sent to window {self.target_window_id}: {text[:50]}...")
             
@@ -225,39 +266,89 @@ class UniversalTerminalController:
     
     async def _send_key_to_window(self, key: str):
         """Send a single key to the target window."""
+        await self._send_keys_to_window([key])
+    
+    async def _send_keys_to_window(self, keys: Sequence[str]):
+        """Send keys to the target window in order, in as few xdotool calls as possible."""
         if not self.target_window_id:
             raise RuntimeError("No target window set")
         
         try:
-            # Activate the window
-            await self._run_xdotool(['windowactivate', self.target_window_id])
-            await asyncio.sleep(0.05)
-            
-            # Send the key
-            await self._run_xdotool(['key', key])
-            
-            self.logger.debug(f"Sent key to window {self.target_window_id}: {key}")
+            # Queue the keys; keys arriving while a send is pending share
+            # one xdotool invocation
+            loop = asyncio.get_running_loop()
+            sent = []
+            for key in keys:
+                done = loop.create_future()
+                self._pending_keys.append((key, done))
+                sent.append(done)
+            if self._key_flusher is None or self._key_flusher.done():
+                self._key_flusher = asyncio.create_task(self._flush_keys())
+            await asyncio.gather(*sent)
+            
+            self.logger.debug(f"Sent keys to window {self.target_window_id}: {' '.join(keys)}")
             
         except Exception as e:
             self.logger.error(f"Error sending key to window: {e}")
             raise
     
-    async def _run_xdotool(self, args: List[str]):
-        """Run xdotool command asynchronously."""
+    async def _flush_keys(self):
+        """Send queued keys in batches, one xdotool call per batch."""
+        while self._pending_keys:
+            batch, self._pending_keys = self._pending_keys, []
+            error = None
+            try:
+                await self._run_xdotool(
+                    self._targeted('key', *(key for key, _ in batch)), capture_stdout=False
+                )
+            except Exception as e:
+                error = e
+            
+            for _, done in batch:
+                if done.done():
+                    continue
+                if error:
+                    done.set_exception(error)
+                else:
+                    done.set_result(None)
+    
+    def _targeted(self, command: str, *args: str) -> Tuple[str, ...]:
+        """Return (cached) xdotool argv that delivers command to the target window."""
+        key = (command, *args)
+        argv = self._argv_cache.get(key)
+        if argv is None:
+            if self.config.focus_before_send:
+                # Activate the window (--sync waits until it has focus) and run
+                # the command, chained in a single xdotool invocation
+                argv = ('windowactivate', '--sync', self.target_window_id, *key)
+            else:
+                # Send synthetic input straight to the window without changing focus
+                argv = (command, '--window', self.target_window_id, *args)
+            self._argv_cache[key] = argv
+        return argv
+    
+    async def _run_xdotool(self, args: Sequence[str], input: Optional[bytes] = None,
+                           capture_stdout: bool = True) -> Optional[str]:
+        """Run xdotool command asynchronously, optionally feeding input on stdin.
+        
+        Actions whose output is not needed pass capture_stdout=False, which
+        discards stdout; stderr is always piped for the error message.
+        """
         try:
             process = await asyncio.create_subprocess_exec(
                 'xdotool', *args,
-                stdout=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
+            stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout=5)
             
             if process.returncode != 0:
                 error_msg = stderr.decode('utf-8').strip()
                 raise RuntimeError(f"xdotool failed: {error_msg}")
                 
-            return stdout.decode('utf-8').strip()
+            return stdout.decode('utf-8').strip() if capture_stdout else None
             
         except Exception as e:
             self.logger.error(f"xdotool command failed: {' '.join(args)} - {e}")
@@ -285,6 +376,9 @@ class UniversalTerminalController:
         """Recapture the target window."""
         self.is_target_set = False
         self.target_window_id = None
+        self._name_cache.clear()
+        self._class_cache.clear()
+        self._argv_cache.clear()
         await self._capture_target_window()
     
     async def cleanup(self):
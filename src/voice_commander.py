@@ -2,7 +2,11 @@
 
 import asyncio
 import logging
-from typing import Optional
+import re
+import signal
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, Deque
 from .config import Config
 from .audio_capture import AudioCapture
 from .speech_to_text import SpeechToTextService
@@ -11,6 +15,41 @@ from .universal_terminal_controller import UniversalTerminalController
 from .feedback_system import FeedbackSystem
 
 
+# Voice keywords, shared by every instance
+_SEND_KEYWORDS = ("send this prompt", "send prompt")
+_EDITING_KEYWORDS = MappingProxyType({
+    "remove_word": ("remove last word",),
+    "clear_line": ("remove this line", "remove complete input"),
+    "start_over": ("start over",),
+})
+_SELECTION_PREFIX = "select option "  # followed by the option digit
+_SELECTION_OPTIONS = "1234"
+_MODE_KEYWORDS = ("change operation mode",)
+_ACTIVATION_KEYWORDS = ("activate voice commander", "start voice commander")
+_DEACTIVATION_KEYWORDS = ("stop voice commander", "deactivate voice commander")
+
+
+def _alternation(keywords) -> str:
+    """Regex alternation of literal keywords, longest first so none loses to its own prefix."""
+    return "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+
+
+# Keyword classes in one alternation, a named group per class;
+# match.lastgroup names the class that fired. Option selection captures
+# its digit in the "option" group.
+_KEYWORD_PATTERNS = MappingProxyType({
+    "activate": _alternation(_ACTIVATION_KEYWORDS),
+    "deactivate": _alternation(_DEACTIVATION_KEYWORDS),
+    "send": _alternation(_SEND_KEYWORDS),
+    **{group: _alternation(keywords) for group, keywords in _EDITING_KEYWORDS.items()},
+    "select": f"{re.escape(_SELECTION_PREFIX)}(?P<option>[{_SELECTION_OPTIONS}])",
+    "mode": _alternation(_MODE_KEYWORDS),
+})
+_KEYWORD_RE = re.compile("|".join(
+    f"(?P<{group}>{pattern})" for group, pattern in _KEYWORD_PATTERNS.items()
+))
+
+
 class VoiceCommander:
     """Main orchestrator for the voice command system."""
     
@@ -19,37 +58,87 @@ class VoiceCommander:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.running = False
+        self._stop_event: Optional[asyncio.Event] = None  # created in start()
+        
+        # Ordered outbox of ("text" | "key", value) for the target terminal;
+        # adjacent text items are coalesced into one send
+        self._type_queue: Optional[asyncio.Queue] = None
+        self._typer_task: Optional[asyncio.Task] = None
+        self.type_batch_window = 0.03  # seconds to wait for more text to join a send
+        
+        # Latest pending UI update per kind ("listening", "partial", "recognized");
+        # drained by a single task so bursts collapse into one update each
+        self._ui_latest: Dict[str, Any] = {}
+        self._ui_dirty: Optional[asyncio.Event] = None
+        self._ui_task: Optional[asyncio.Task] = None
+        self.ui_update_interval = 0.05  # seconds
         
         # Initialize components
         self.audio_capture = AudioCapture(config.audio)
         self.speech_service = SpeechToTextService(config.whisper)
-        # Simple text accumulation state
-        self.accumulated_text = ""
+        # Simple text accumulation state (words typed so far; joined on demand)
+        self._words: Deque[str] = deque()
         self.is_accumulating = False
-        self.send_keywords = ["send this prompt", "send prompt"]
-        self.editing_keywords = ["remove last word", "remove this line", "remove complete input", "start over"]
-        self.selection_keywords = {
-            "select option 1": "1",
-            "select option 2": "2",
-            "select option 3": "3",
-            "select option 4": "4"
-        }
-        self.mode_keywords = ["change operation mode"]
-        self.activation_keywords = ["activate voice commander", "start voice commander"]
-        self.deactivation_keywords = ["stop voice commander", "deactivate voice commander"]
+        self._build_command_handlers()
         self.listening_state = "SLEEPING"  # Start in safe mode
+        self.speech_service.partials_paused = True  # no partial decodes while sleeping
         self.confidence_threshold = 0.3
         # Use universal controller that works with any focused terminal
         self.terminal_controller = UniversalTerminalController(config.claude)
         self.feedback_system = FeedbackSystem(config.feedback, self.terminal_controller)
         
+        # Lifecycle hooks, resolved once; components without a hook are skipped
+        self._initializers: List[Tuple[str, Callable[[], Awaitable[None]]]] = [
+            (name, component.initialize)
+            for name, component in [
+                ("Speech Service", self.speech_service),
+                ("Terminal Controller", self.terminal_controller),
+                ("Feedback System", self.feedback_system)
+            ]
+            if hasattr(component, 'initialize')
+        ]
+        self._cleanups: List[Callable[[], Awaitable[None]]] = [
+            component.cleanup
+            for component in [self.feedback_system, self.terminal_controller,
+                              self.speech_service, self.audio_capture]
+            if hasattr(component, 'cleanup')
+        ]
+        
         # Event handling
         self._setup_event_handlers()
     
+    @property
+    def accumulated_text(self) -> str:
+        """Text typed since the last send/clear."""
+        return " ".join(self._words)
+    
+    def _build_command_handlers(self):
+        """Bind keyword classes to their handlers."""
+        # Command handlers by group, in priority order (used only while ACTIVE)
+        self._command_handlers = {
+            "send": self._press_send,
+            "remove_word": self._remove_last_word,
+            "clear_line": self._clear_line,
+            "start_over": self._start_over,
+            "select": self._select_option,
+            "mode": self._change_mode,
+        }
+    
+    def _match_keywords(self, normalized_text: str) -> Dict[str, str]:
+        """Scan the text once, returning {group: payload} for every class found.
+        
+        The payload is the option digit for "select", else the matched keyword.
+        """
+        hits: Dict[str, str] = {}
+        for match in _KEYWORD_RE.finditer(normalized_text):
+            hits.setdefault(match.lastgroup, match.group("option") or match.group(0))
+        return hits
+    
     def _setup_event_handlers(self):
         """Set up event handlers between components."""
         # Audio -> Speech-to-Text
         self.audio_capture.on_audio_captured = self._handle_audio_captured
+        self.audio_capture.on_utterance_end = self._handle_utterance_end
         
         # Speech-to-Text -> Command Processing
         self.speech_service.on_text_recognized = self._handle_text_recognized
@@ -62,16 +151,18 @@ class VoiceCommander:
         # Removed other handlers - no longer needed for simplified approach
         
         # Error handling
-        for component in [self.audio_capture, self.speech_service, 
-                         self.terminal_controller]:
-            if hasattr(component, 'on_error'):
-                component.on_error = self._handle_component_error
+        self.audio_capture.on_error = self._handle_component_error
+        self.speech_service.on_error = self._handle_component_error
+        self.terminal_controller.on_error = self._handle_component_error
     
     async def start(self):
         """Start the voice commander system."""
         try:
             self.logger.info("Starting voice commander components...")
             self.running = True
+            self._stop_event = asyncio.Event()
+            self._start_typer()
+            self._start_ui()
             
             # Initialize all components
             await self._initialize_components()
@@ -82,9 +173,16 @@ class VoiceCommander:
             self.logger.info("Voice Commander is ready! Speak your commands...")
             await self.feedback_system.play_ready_sound()
             
-            # Main event loop
+            # Main event loop: park until stop() or Ctrl+C
             await self._main_loop()
+            if self.running:
+                await self.stop()
             
+        except asyncio.CancelledError:
+            # Shut components down, then let the cancellation propagate
+            if self.running:
+                await self.stop()
+            raise
         except Exception as e:
             self.logger.error(f"Error starting voice commander: {e}")
             await self.stop()
@@ -94,6 +192,14 @@ class VoiceCommander:
         """Stop the voice commander system."""
         self.logger.info("Stopping voice commander...")
         self.running = False
+        if self._stop_event:
+            self._stop_event.set()
+        if self._typer_task:
+            self._typer_task.cancel()
+            self._typer_task = None
+        if self._ui_task:
+            self._ui_task.cancel()
+            self._ui_task = None
         
         # Stop all components
         if hasattr(self, 'audio_capture'):
@@ -105,74 +211,180 @@ class VoiceCommander:
         self.logger.info("Voice commander stopped")
     
     async def _initialize_components(self):
-        """Initialize all components."""
-        components = [
-            ("Speech Service", self.speech_service),
-            ("Terminal Controller", self.terminal_controller),
-            ("Feedback System", self.feedback_system)
-        ]
+        """Initialize all components concurrently; the first failure cancels the rest."""
+        tasks = {
+            asyncio.ensure_future(initialize()): name
+            for name, initialize in self._initializers
+        }
         
-        for name, component in components:
-            try:
-                if hasattr(component, 'initialize'):
-                    await component.initialize()
-                    self.logger.debug(f"Initialized {name}")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize {name}: {e}")
-                raise
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        
+        # Stop the others before they act, e.g. typing the test message
+        # into whatever window has focus
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        
+        error = None
+        for task, name in tasks.items():
+            if task.cancelled():
+                self.logger.debug("Cancelled initialization of %s", name)
+            elif task.exception():
+                self.logger.error(f"Failed to initialize {name}: {task.exception()}")
+                error = error or task.exception()
+            else:
+                self.logger.debug("Initialized %s", name)
+        
+        if error:
+            raise error
     
     async def _cleanup_components(self):
-        """Cleanup all components."""
-        components = [self.feedback_system, self.terminal_controller, 
-                     self.speech_service, self.audio_capture]
+        """Cleanup all components concurrently."""
+        results = await asyncio.gather(
+            *(cleanup() for cleanup in self._cleanups),
+            return_exceptions=True
+        )
         
-        for component in components:
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.warning("Error cleaning up component: %s", result)
+    
+    def _start_typer(self):
+        """Create the terminal outbox and the task that drains it."""
+        self._type_queue = asyncio.Queue()
+        self._typer_task = asyncio.create_task(self._typer_loop())
+    
+    def _queue_text(self, text: str):
+        """Queue text to be typed into the target terminal."""
+        self._type_queue.put_nowait(("text", text))
+    
+    def _queue_key(self, key: str):
+        """Queue a key press, kept in order with queued text."""
+        self._type_queue.put_nowait(("key", key))
+    
+    async def _typer_loop(self):
+        """Send queued text and keys in order, one send per run of adjacent items of a kind."""
+        queue = self._type_queue
+        item = None
+        while True:
+            if item is None:
+                item = await queue.get()
+            kind, value = item
+            item = None
+            
             try:
-                if hasattr(component, 'cleanup'):
-                    await component.cleanup()
+                if kind == "text":
+                    # Give closely following segments a moment to join this send
+                    await asyncio.sleep(self.type_batch_window)
+                
+                # Collect the run of same-kind items queued behind this one
+                values = [value]
+                while not queue.empty():
+                    following = queue.get_nowait()
+                    if following[0] != kind:
+                        item = following  # other kind: send it after this run
+                        break
+                    values.append(following[1])
+                
+                if kind == "text":
+                    await self.terminal_controller._send_to_window("".join(values))
+                else:
+                    await self.terminal_controller._send_keys_to_window(values)
+                    
             except Exception as e:
-                self.logger.warning(f"Error cleaning up component: {e}")
+                self.logger.error(f"Error sending to terminal: {e}")
     
-    async def _main_loop(self):
-        """Main event processing loop."""
-        while self.running:
+    def _start_ui(self):
+        """Create the UI update slot and the task that drains it."""
+        self._ui_latest = {}
+        self._ui_dirty = asyncio.Event()
+        self._ui_task = asyncio.create_task(self._ui_loop())
+    
+    def _post_ui(self, kind: str, value: Any = None):
+        """Record the latest UI update of a kind; older pending ones are dropped."""
+        self._ui_latest[kind] = value
+        self._ui_dirty.set()
+    
+    async def _ui_loop(self):
+        """Apply pending UI updates at most once per ui_update_interval."""
+        while True:
+            await self._ui_dirty.wait()
+            await asyncio.sleep(self.ui_update_interval)
+            self._ui_dirty.clear()
+            pending, self._ui_latest = self._ui_latest, {}
+            
             try:
-                # Process any pending events
-                await asyncio.sleep(0.1)
-                
-            except KeyboardInterrupt:
-                self.logger.info("Received interrupt signal")
-                break
+                if "listening" in pending:
+                    await self.feedback_system.show_listening_indicator()
+                if "partial" in pending:
+                    await self.feedback_system.show_partial_text(pending["partial"])
+                if "recognized" in pending:
+                    await self.feedback_system.show_recognized_text(pending["recognized"])
             except Exception as e:
-                self.logger.error(f"Error in main loop: {e}")
-                if self.config.debug_mode:
-                    raise
+                self.logger.error(f"Error updating feedback display: {e}")
+    
+    async def _main_loop(self):
+        """Main event processing loop (components are event driven; just wait for stop)."""
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self._on_interrupt)
+        except (NotImplementedError, RuntimeError):
+            # No loop signal handlers on this platform / thread
+            pass
+        
+        try:
+            await self._stop_event.wait()
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGINT)
+            except (NotImplementedError, RuntimeError):
+                pass
+    
+    def _on_interrupt(self):
+        """Handle Ctrl+C by waking the main loop."""
+        self.logger.info("Received interrupt signal")
+        self._stop_event.set()
     
-    async def _handle_audio_captured(self, audio_data: bytes):
-        """Handle captured audio data."""
+    async def _handle_audio_captured(self, audio_data: memoryview):
+        """Handle captured audio data (a pooled buffer, valid only during this call)."""
         try:
-            self.logger.debug("Audio captured, processing...")
-            await self.feedback_system.show_listening_indicator()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Audio captured, processing...")
+            if self.listening_state != "SLEEPING":
+                self._post_ui("listening")
             
-            # Send to speech recognition
+            # Send to speech recognition (still needed while sleeping,
+            # to hear the activation keywords)
             await self.speech_service.process_audio(audio_data)
             
         except Exception as e:
             self.logger.error(f"Error processing audio: {e}")
             await self.feedback_system.show_error("Audio processing failed")
     
+    async def _handle_utterance_end(self):
+        """Handle the end of a captured utterance."""
+        try:
+            await self.speech_service.end_utterance()
+        except Exception as e:
+            self.logger.error(f"Error finishing utterance: {e}")
+    
     async def _handle_partial_text(self, text: str):
         """Handle partial text for real-time display."""
+        # Nothing is shown for speech that will be ignored
+        if self.listening_state == "SLEEPING":
+            return
+        
         try:
-            await self.feedback_system.show_partial_text(text)
+            self._post_ui("partial", text)
         except Exception as e:
             self.logger.error(f"Error showing partial text: {e}")
     
     async def _handle_text_recognized(self, text: str, confidence: float):
         """Handle recognized speech text."""
         try:
-            self.logger.info(f"Recognized: '{text}' (confidence: {confidence:.2f})")
-            await self.feedback_system.show_recognized_text(text)
+            self.logger.info("Recognized: '%s' (confidence: %.2f)", text, confidence)
+            self._post_ui("recognized", text)
             
             # Simple text processing
             await self._process_simple_text(text, confidence)
@@ -183,129 +395,135 @@ class VoiceCommander:
     
     async def _process_simple_text(self, text: str, confidence: float):
         """Simple text processing with voice activation control."""
+        # Local aliases for attributes used on most paths
+        log = self.logger
+        feedback = self.feedback_system
+        words = self._words
+        
         try:
             # Check confidence threshold
             if confidence < self.confidence_threshold:
-                self.logger.warning(f"Low confidence recognition: {confidence}")
+                log.warning("Low confidence recognition: %s", confidence)
                 return
             
             # Normalize text
             normalized_text = text.lower().strip()
             
+            # Single pass over the text for every keyword group
+            hits = self._match_keywords(normalized_text)
+            
             # Handle activation/deactivation regardless of current state
-            if any(keyword in normalized_text for keyword in self.activation_keywords):
+            if "activate" in hits:
                 if self.listening_state == "SLEEPING":
                     self.listening_state = "ACTIVE"
-                    self.logger.info("Voice Commander ACTIVATED - Now listening for all commands")
-                    await self.feedback_system.show_success("Voice Commander activated")
+                    self.speech_service.partials_paused = False
+                    log.info("Voice Commander ACTIVATED - Now listening for all commands")
+                    await feedback.show_success("Voice Commander activated")
                 return
             
-            if any(keyword in normalized_text for keyword in self.deactivation_keywords):
+            if "deactivate" in hits:
                 if self.listening_state == "ACTIVE":
                     self.listening_state = "SLEEPING"
+                    self.speech_service.partials_paused = True
                     # Clear any accumulated text when deactivating
-                    self.accumulated_text = ""
+                    words.clear()
                     self.is_accumulating = False
-                    self.logger.info("Voice Commander DEACTIVATED - Only listening for activation keywords")
-                    await self.feedback_system.show_success("Voice Commander deactivated")
+                    log.info("Voice Commander DEACTIVATED - Only listening for activation keywords")
+                    await feedback.show_success("Voice Commander deactivated")
                 return
             
             # If sleeping, ignore all other commands
             if self.listening_state == "SLEEPING":
-                self.logger.debug(f"Ignoring text while sleeping: '{text}'")
+                log.debug("Ignoring text while sleeping: '%s'", text)
                 return
             
             # Continue with normal processing only if ACTIVE
             
-            # Check for send keywords (acts like Enter key)
-            if any(keyword in normalized_text for keyword in self.send_keywords):
-                # Just press Enter - text is already typed in Claude terminal
-                self.logger.info("Pressing Enter key")
-                await self.terminal_controller._send_key_to_window("Return")
-                
-                # Reset accumulation state for next command
-                self.accumulated_text = ""
-                self.is_accumulating = False
-                
-                await self.feedback_system.show_success("Sent (Enter pressed)")
-                return
-            
-            # Check for editing commands (act like keyboard shortcuts)
-            if any(keyword in normalized_text for keyword in self.editing_keywords):
-                if "remove last word" in normalized_text:
-                    # Send Alt+Backspace to remove last word in terminal
-                    self.logger.info("Removing last word (Alt+Backspace)")
-                    await self.terminal_controller._send_key_to_window("alt+BackSpace")
-                    
-                    # Update internal state
-                    if self.accumulated_text:
-                        words = self.accumulated_text.split()
-                        if words:
-                            words.pop()
-                            self.accumulated_text = " ".join(words)
-                    
-                    await self.feedback_system.show_success("Removed last word")
-                
-                elif "remove this line" in normalized_text or "remove complete input" in normalized_text:
-                    # Send Ctrl+U to clear current line in terminal
-                    self.logger.info("Clearing line (Ctrl+U)")
-                    await self.terminal_controller._send_key_to_window("ctrl+u")
-                    
-                    # Reset internal state
-                    self.accumulated_text = ""
-                    self.is_accumulating = False
-                    
-                    await self.feedback_system.show_success("Cleared line")
-                
-                elif "start over" in normalized_text:
-                    # Send Ctrl+A then Delete to clear everything
-                    self.logger.info("Clearing all (Ctrl+A, Delete)")
-                    await self.terminal_controller._send_key_to_window("ctrl+a")
-                    await asyncio.sleep(0.1)
-                    await self.terminal_controller._send_key_to_window("Delete")
-                    
-                    # Reset internal state
-                    self.accumulated_text = ""
-                    self.is_accumulating = False
-                    
-                    await self.feedback_system.show_success("Started over")
-                
-                return
-            
-            # Check for option selection commands
-            for phrase, number in self.selection_keywords.items():
-                if phrase in normalized_text:
-                    # Send number key for option selection
-                    self.logger.info(f"Selecting option {number}")
-                    await self.terminal_controller._send_key_to_window(number)
-                    await self.feedback_system.show_success(f"Selected option {number}")
+            # Keyword commands (Enter, editing shortcuts, option selection, mode change)
+            for group, handler in self._command_handlers.items():
+                if group in hits:
+                    await handler(hits[group])
                     return
             
-            # Check for mode change command
-            if any(keyword in normalized_text for keyword in self.mode_keywords):
-                # Send Shift+Tab to change operation mode
-                self.logger.info("Changing operation mode (Shift+Tab)")
-                await self.terminal_controller._send_key_to_window("shift+Tab")
-                await self.feedback_system.show_success("Changed operation mode")
-                return
-            
             # Type text directly into Claude terminal (like a keyboard)
             if not self.is_accumulating:
                 # Start typing - send text immediately to Claude
                 self.is_accumulating = True
-                self.accumulated_text = text
-                self.logger.info(f"Typing: '{text}'")
-                await self.terminal_controller._send_to_window(text)
-                await self.feedback_system.show_text_accumulation_started(text)
+                words.clear()
+                words.extend(text.split())
+                log.info("Typing: '%s'", text)
+                self._queue_text(text)
+                await feedback.show_text_accumulation_started(text)
             else:
                 # Continue typing - add space and new text
-                self.accumulated_text += " " + text
-                self.logger.info(f"Typing more: '{text}' -> Full: '{self.accumulated_text}'")
-                await self.terminal_controller._send_to_window(" " + text)
-                await self.feedback_system.show_text_accumulated(text, self.accumulated_text)
+                words.extend(text.split())
+                log.info("Typing more: '%s'", text)
+                self._queue_text(" " + text)
+                # The feedback system joins the words only if it logs them
+                await feedback.show_text_accumulated(text, words)
                 
         except Exception as e:
-            self.logger.error(f"Error in simple text processing: {e}")
+            log.error(f"Error in simple text processing: {e}")
+    
+    async def _press_send(self, _keyword: str):
+        """Press Enter - text is already typed in Claude terminal."""
+        self.logger.info("Pressing Enter key")
+        self._queue_key("Return")
+        
+        # Reset accumulation state for next command
+        self._words.clear()
+        self.is_accumulating = False
+        
+        await self.feedback_system.show_success("Sent (Enter pressed)")
+    
+    async def _remove_last_word(self, _keyword: str):
+        """Send Alt+Backspace to remove last word in terminal."""
+        self.logger.info("Removing last word (Alt+Backspace)")
+        self._queue_key("alt+BackSpace")
+        
+        # Update internal state
+        if self._words:
+            self._words.pop()
+        
+        await self.feedback_system.show_success("Removed last word")
+    
+    async def _clear_line(self, _keyword: str):
+        """Send Ctrl+U to clear current line in terminal."""
+        self.logger.info("Clearing line (Ctrl+U)")
+        self._queue_key("ctrl+u")
+        
+        # Reset internal state
+        self._words.clear()
+        self.is_accumulating = False
+        
+        await self.feedback_system.show_success("Cleared line")
+    
+    async def _start_over(self, _keyword: str):
+        """Send Ctrl+A then Delete to clear everything."""
+        self.logger.info("Clearing all (Ctrl+A, Delete)")
+        # The outbox batches these into one `xdotool key ctrl+a Delete` call;
+        # xdotool presses them in order with its 12 ms inter-key delay, and the
+        # terminal reads the X events in that order, so no settle delay is needed
+        self._queue_key("ctrl+a")
+        self._queue_key("Delete")
+        
+        # Reset internal state
+        self._words.clear()
+        self.is_accumulating = False
+        
+        await self.feedback_system.show_success("Started over")
+    
+    async def _select_option(self, number: str):
+        """Send number key for option selection."""
+        self.logger.info("Selecting option %s", number)
+        self._queue_key(number)
+        await self.feedback_system.show_success(f"Selected option {number}")
+    
+    async def _change_mode(self, _keyword: str):
+        """Send Shift+Tab to change operation mode."""
+        self.logger.info("Changing operation mode (Shift+Tab)")
+        self._queue_key("shift+Tab")
+        await self.feedback_system.show_success("Changed operation mode")
     
     # Removed _handle_command_validated - no longer needed
     
@@ -313,10 +531,10 @@ class VoiceCommander:
         """Handle terminal action completion."""
         try:
             if success:
-                self.logger.info(f"Action completed: {action}")
+                self.logger.info("Action completed: %s", action)
                 await self.feedback_system.show_success(f"{action} completed")
             else:
-                self.logger.warning(f"Action failed: {action} - {details}")
+                self.logger.warning("Action failed: %s - %s", action, details)
                 await self.feedback_system.show_error(f"{action} failed: {details}")
                 
         except Exception as e: